@@ -0,0 +1,42 @@
+"""Build the FAQ answer pack served by /api/chat without loading the model.
+
+Runs every question in FAQ_QUESTIONS_PATH through the RAG pipeline and
+writes the answers, sources and index version to FAQ_PACK_PATH, or to
+FAQ_S3_PACK_PATH with --s3 so the local server never overwrites it.
+
+Usage:
+    python -m app.build_faq         # local documents (app.local_main)
+    python -m app.build_faq --s3    # S3 documents (Lambda image)
+"""
+import sys
+from app.services.faq import load_faq_questions, build_answer_pack, write_answer_pack
+from app.config import get_settings
+
+settings = get_settings()
+
+def build_s3_pack() -> bool:
+    from app.services.rag_service import rag_service
+    from app.services.s3_index import s3_index_version
+
+    questions = load_faq_questions()
+    if not questions:
+        return False
+
+    # Versioned before loading, so a concurrent upload makes the pack stale, not wrong
+    index_version = s3_index_version()
+    print(f"📦 Building FAQ answer pack from S3 ({len(questions)} questions)...")
+    pack = build_answer_pack(rag_service.get_chain(), questions, index_version, corpus="s3")
+    write_answer_pack(pack, settings.faq_s3_pack_path)
+    return True
+
+def build_local_pack() -> bool:
+    from app.services.local_rag_service import rag_service
+
+    # Build in the foreground instead of the background rebuild thread
+    rag_service.faq_auto_rebuild = False
+    return rag_service.build_faq_pack(force=True)
+
+if __name__ == "__main__":
+    built = build_s3_pack() if "--s3" in sys.argv[1:] else build_local_pack()
+    if not built:
+        print(f"⚠️  No FAQ questions found in: {settings.faq_questions_path}")
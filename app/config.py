@@ -22,6 +22,16 @@ class Settings(BaseSettings):
     documents_path: str = "./data/documents"
     chroma_db_path: str = "./chroma_db"
     
+    # Document watcher (local only)
+    watch_documents: bool = False
+    watch_debounce_seconds: float = 2.0
+    watch_poll_interval: float = 1.0
+    
+    # FAQ answer pack
+    faq_questions_path: str = "./data/faq.txt"
+    faq_pack_path: str = "./data/faq_pack.json"
+    faq_s3_pack_path: str = "./data/faq_pack.s3.json"
+    
     # AWS settings (only used in production) IG
     s3_bucket_name: str = ""
     aws_region: str = "eu-north-1"
@@ -4,7 +4,7 @@ from pydantic import BaseModel
 from typing import List, Optional
 import uuid
 from langchain.memory import ConversationBufferMemory
-from app.services.rag_service import rag_service
+from app.services.local_rag_service import rag_service
 from app.config import get_settings
 
 settings = get_settings()
@@ -32,6 +32,8 @@ app.add_middleware(
 
 # Session storage
 sessions = {}
+# Turns answered from the FAQ pack before a session had any memory
+faq_turns = {}
 
 # Models
 class ChatRequest(BaseModel):
@@ -49,6 +51,7 @@ class HealthResponse(BaseModel):
     active_sessions: int
     environment: str
     documents_path: str
+    watching_documents: bool
 
 # Startup event
 @app.on_event("startup")
@@ -63,6 +66,13 @@ async def startup_event():
         print("\n📝 Quick fix:")
         print(f"1. Make sure documents exist in: {settings.documents_path}")
         print(f"2. Check your .env file has GROQ_API_KEY set")
+    
+    if settings.watch_documents:
+        rag_service.start_watcher()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    rag_service.stop_watcher()
 
 @app.get("/")
 async def root():
@@ -81,11 +91,29 @@ async def health_check():
         rag_initialized=rag_service.is_initialized,
         active_sessions=len(sessions),
         environment=settings.environment,
-        documents_path=settings.documents_path
+        documents_path=settings.documents_path,
+        watching_documents=rag_service.watcher is not None
     )
 
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
+    # Generate or use existing session ID
+    session_id = request.session_id or str(uuid.uuid4())
+    
+    # Answer known questions from the prebuilt pack while the session has no history
+    if session_id not in sessions:
+        faq_answer = rag_service.faq_pack.lookup(request.message)
+        if faq_answer is not None:
+            print(f"\n📦 FAQ hit: {request.message}")
+            faq_turns.setdefault(session_id, []).append(
+                (request.message, faq_answer["answer"])
+            )
+            return ChatResponse(
+                response=faq_answer["answer"],
+                session_id=session_id,
+                sources=faq_answer["sources"]
+            )
+    
     try:
         qa_chain = rag_service.get_chain()
     except Exception as e:
@@ -94,9 +122,6 @@ async def chat(request: ChatRequest):
             detail=f"RAG system not initialized: {str(e)}"
         )
     
-    # Generate or use existing session ID
-    session_id = request.session_id or str(uuid.uuid4())
-    
     # Get or create memory for this session
     if session_id not in sessions:
         sessions[session_id] = ConversationBufferMemory(
@@ -104,6 +129,12 @@ async def chat(request: ChatRequest):
             return_messages=True,
             output_key="answer"
         )
+        # Replay earlier FAQ answers so follow-up questions keep their context
+        for question, answer in faq_turns.pop(session_id, []):
+            sessions[session_id].save_context(
+                {"question": question},
+                {"answer": answer}
+            )
     
     try:
         print(f"\n💬 Question: {request.message}")
@@ -154,8 +185,9 @@ async def new_session():
 @app.delete("/api/chat/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete a chat session"""
-    if session_id in sessions:
-        del sessions[session_id]
+    if session_id in sessions or session_id in faq_turns:
+        sessions.pop(session_id, None)
+        faq_turns.pop(session_id, None)
         print(f"🗑️  Session deleted: {session_id}")
         return {"message": "Session deleted"}
     raise HTTPException(status_code=404, detail="Session not found")
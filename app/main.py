@@ -3,10 +3,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
 import uuid
-from langchain.memory import ConversationBufferMemory
-from app.services.rag_service import rag_service
+from app.services.faq import FAQAnswerPack
+from app.services.s3_index import s3_index_version
+from app.config import get_settings
 import os
 
+settings = get_settings()
+
 app = FastAPI(
     title="Portfolio AI Assistant",
     description="Portfolio assistant using Groq + RAG",
@@ -30,6 +33,26 @@ app.add_middleware(
 
 # Session storage
 sessions = {}
+# Turns answered from the FAQ pack before a session had any memory
+faq_turns = {}
+
+# The RAG service pulls in LangChain, torch and Groq, so it is only
+# imported once a question is not answered from the FAQ pack
+_rag_service = None
+
+def get_rag_service():
+    global _rag_service
+    if _rag_service is None:
+        from app.services.rag_service import rag_service
+        _rag_service = rag_service
+    return _rag_service
+
+# Only answers from a pack built against the current S3 documents
+faq_pack = FAQAnswerPack(
+    corpus="s3",
+    corpus_version=s3_index_version,
+    path=settings.faq_s3_pack_path
+)
 
 # Models
 class ChatRequest(BaseModel):
@@ -45,7 +68,7 @@ class ChatResponse(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     try:
-        rag_service.initialize()
+        get_rag_service().initialize()
     except Exception as e:
         print(f"❌ Error initializing RAG: {str(e)}")
 
@@ -61,31 +84,51 @@ async def root():
 async def health_check():
     return {
         "status": "healthy",
-        "rag_initialized": rag_service.qa_chain is not None,
+        "rag_initialized": _rag_service is not None and _rag_service.qa_chain is not None,
         "active_sessions": len(sessions),
         "platform": "AWS Lambda" if os.getenv('AWS_EXECUTION_ENV') else "Local"
     }
 
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
+    # Generate or use existing session ID
+    session_id = request.session_id or str(uuid.uuid4())
+    
+    # Answer known questions from the prebuilt pack while the session has no history
+    if session_id not in sessions:
+        faq_answer = faq_pack.lookup(request.message)
+        if faq_answer is not None:
+            faq_turns.setdefault(session_id, []).append(
+                (request.message, faq_answer["answer"])
+            )
+            return ChatResponse(
+                response=faq_answer["answer"],
+                session_id=session_id,
+                sources=faq_answer["sources"]
+            )
+    
     try:
-        qa_chain = rag_service.get_chain()
+        qa_chain = get_rag_service().get_chain()
     except Exception as e:
         raise HTTPException(
             status_code=503, 
             detail=f"RAG system not initialized: {str(e)}"
         )
     
-    # Generate or use existing session ID
-    session_id = request.session_id or str(uuid.uuid4())
-    
     # Get or create memory for this session
     if session_id not in sessions:
+        from langchain.memory import ConversationBufferMemory
         sessions[session_id] = ConversationBufferMemory(
             memory_key="chat_history",
             return_messages=True,
             output_key="answer"
         )
+        # Replay earlier FAQ answers so follow-up questions keep their context
+        for question, answer in faq_turns.pop(session_id, []):
+            sessions[session_id].save_context(
+                {"question": question},
+                {"answer": answer}
+            )
     
     try:
         # Get response from RAG chain
@@ -129,8 +172,9 @@ async def new_session():
 @app.delete("/api/chat/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete a chat session"""
-    if session_id in sessions:
-        del sessions[session_id]
+    if session_id in sessions or session_id in faq_turns:
+        sessions.pop(session_id, None)
+        faq_turns.pop(session_id, None)
         return {"message": "Session deleted"}
     raise HTTPException(status_code=404, detail="Session not found")
 
@@ -138,7 +182,9 @@ async def delete_session(session_id: str):
 async def refresh_documents():
     """Rebuild the vector store with updated documents"""
     try:
-        rag_service.initialize()
+        # Re-check the pack against the S3 documents the chain now uses
+        faq_pack.invalidate()
+        get_rag_service().initialize()
         return {"message": "Documents refreshed successfully"}
     except Exception as e:
         raise HTTPException(
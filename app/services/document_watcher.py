@@ -0,0 +1,175 @@
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Set
+from app.services.local_loader import LocalDocumentLoader
+from app.config import get_settings
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Not available on every platform, fall back to polling
+    INotify = None
+
+settings = get_settings()
+
+class DocumentWatcher:
+    """Watch the documents directory and report changed paths in batches"""
+
+    def __init__(
+        self,
+        loader: LocalDocumentLoader,
+        on_change: Callable[[Set[str]], None],
+        debounce_seconds: float = None,
+        poll_interval: float = None
+    ):
+        self.loader = loader
+        self.documents_path = loader.documents_path
+        self.on_change = on_change
+        self.debounce_seconds = (
+            settings.watch_debounce_seconds if debounce_seconds is None else debounce_seconds
+        )
+        self.poll_interval = (
+            settings.watch_poll_interval if poll_interval is None else poll_interval
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify = None
+        self._watches: Dict[int, str] = {}
+        self._snapshot = {}
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    def start(self):
+        """Start watching in a background thread"""
+        if self._thread is not None:
+            return
+
+        os.makedirs(self.documents_path, exist_ok=True)
+        self._stop.clear()
+        self._setup_inotify()
+        if self._inotify is None:
+            self._snapshot = self.loader.scan_files()
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="document-watcher",
+            daemon=True
+        )
+        self._thread.start()
+        print(f"👀 Watching {self.documents_path} ({self.mode})")
+
+    def stop(self):
+        """Stop watching and wait for the thread to exit"""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watches = {}
+
+    def _run(self):
+        pending = set()
+        deadline = None
+
+        while not self._stop.is_set():
+            if deadline is None:
+                timeout = self.poll_interval
+            else:
+                timeout = max(0.0, min(self.poll_interval, deadline - time.monotonic()))
+
+            try:
+                changed = self._wait_for_changes(timeout)
+            except Exception as e:
+                print(f"❌ Watcher error: {str(e)}")
+                self._stop.wait(self.poll_interval)
+                continue
+
+            if changed:
+                # Restart the debounce window on every new event
+                pending |= changed
+                deadline = time.monotonic() + self.debounce_seconds
+            elif pending and time.monotonic() >= deadline:
+                batch, pending, deadline = pending, set(), None
+                try:
+                    self.on_change(batch)
+                except Exception as e:
+                    print(f"❌ Error applying document changes: {str(e)}")
+
+    def _wait_for_changes(self, timeout: float) -> Set[str]:
+        if self._inotify is not None:
+            return self._read_inotify(timeout)
+        return self._poll(timeout)
+
+    # Polling fallback
+
+    def _poll(self, timeout: float) -> Set[str]:
+        if self._stop.wait(timeout):
+            return set()
+
+        snapshot = self.loader.scan_files()
+        changed = {
+            path for path in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    # inotify
+
+    def _setup_inotify(self):
+        if INotify is None:
+            return
+
+        try:
+            self._inotify = INotify()
+            self._add_watches(self.documents_path)
+        except OSError as e:
+            # e.g. watch limit reached
+            print(f"⚠️  inotify unavailable, falling back to polling: {str(e)}")
+            if self._inotify is not None:
+                self._inotify.close()
+            self._inotify = None
+            self._watches = {}
+
+    def _add_watches(self, directory: str):
+        mask = (
+            flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM
+            | flags.CREATE | flags.DELETE | flags.DELETE_SELF
+        )
+        for root, _, _ in os.walk(directory):
+            wd = self._inotify.add_watch(root, mask)
+            self._watches[wd] = root
+
+    def _read_inotify(self, timeout: float) -> Set[str]:
+        changed = set()
+
+        for event in self._inotify.read(timeout=int(timeout * 1000)):
+            if event.mask & flags.Q_OVERFLOW:
+                # Events were dropped, let the index diff the whole directory
+                changed.add(self.documents_path)
+                continue
+
+            directory = self._watches.get(event.wd)
+            if directory is None:
+                continue
+
+            if event.mask & (flags.DELETE_SELF | flags.IGNORED):
+                self._watches.pop(event.wd, None)
+                continue
+
+            path = os.path.join(directory, event.name)
+            if event.mask & flags.ISDIR:
+                if event.mask & (flags.CREATE | flags.MOVED_TO):
+                    self._add_watches(path)
+                changed.add(path)
+            elif event.mask & (flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM | flags.DELETE):
+                # Plain CREATE is followed by CLOSE_WRITE once the file is written
+                changed.add(path)
+
+        return changed
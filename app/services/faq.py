@@ -0,0 +1,209 @@
+import json
+import os
+import re
+import threading
+import unicodedata
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from app.config import get_settings
+
+# Keep this module free of LangChain/torch imports: it runs in front of
+# the RAG chain so matched questions never pay for loading it.
+
+settings = get_settings()
+
+PACK_FORMAT = 1
+
+# Politeness and filler words ignored by the reworded-question match.
+# Never add negations or content words: the match must not change meaning.
+FILLER_WORDS = {
+    "a", "an", "the", "please", "hi", "hello", "hey",
+    "can", "could", "would", "you", "tell", "me", "about"
+}
+
+def normalize_question(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+def question_key(normalized: str) -> frozenset:
+    """Content words of a normalized question, ignoring order and filler"""
+    return frozenset(word for word in normalized.split() if word not in FILLER_WORDS)
+
+def load_faq_questions(path: str = None) -> List[str]:
+    """Read the FAQ list, one question per line ('#' starts a comment)"""
+    path = path or settings.faq_questions_path
+    if not os.path.exists(path):
+        return []
+
+    questions = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                questions.append(line)
+    return questions
+
+def build_answer_pack(qa_chain, questions: List[str], index_version: str, corpus: str) -> Dict:
+    """Run every FAQ question through the RAG chain as a first turn"""
+    entries = []
+    for question in questions:
+        print(f"💬 FAQ: {question}")
+        result = qa_chain({"question": question, "chat_history": []})
+        sources = sorted(set(
+            doc.metadata.get("source", "Unknown")
+            for doc in result.get("source_documents", [])
+        ))
+        entries.append({
+            "question": question,
+            "normalized": normalize_question(question),
+            "answer": result["answer"],
+            "sources": sources
+        })
+
+    return {
+        "format": PACK_FORMAT,
+        "corpus": corpus,
+        "index_version": index_version,
+        "model_name": settings.model_name,
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "entries": entries
+    }
+
+def write_answer_pack(pack: Dict, path: str = None):
+    """Write the pack atomically so a running server never reads half a file"""
+    path = path or settings.faq_pack_path
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(pack, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    print(f"✅ FAQ answer pack written to: {path} ({len(pack['entries'])} answers)")
+
+class FAQAnswerPack:
+    """Answer known questions from a prebuilt pack without touching the model"""
+
+    def __init__(
+        self,
+        corpus: str,
+        corpus_version: Callable[[], str] = None,
+        path: str = None
+    ):
+        self.corpus = corpus
+        # Optional check that the pack matches the documents being served
+        self.corpus_version = corpus_version
+        self.path = path or settings.faq_pack_path
+        self.pack = None
+        self.servable = False
+        self._by_question = {}
+        self._by_key = {}
+        self._mtime = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Stop serving the pack until it is checked against the documents again"""
+        # No lock: callers may hold locks that corpus_version() needs
+        self._generation += 1
+        self.servable = False
+        self._mtime = None
+
+    def _load(self):
+        """(Re)load the pack when the file on disk changed"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            self.pack, self._by_question, self._by_key, self._mtime = None, {}, {}, None
+            self.servable = False
+            return
+
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            generation = self._generation
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    pack = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"❌ Error loading FAQ answer pack: {str(e)}")
+                return
+
+            if pack.get("format") != PACK_FORMAT:
+                print(f"⚠️  Ignoring FAQ answer pack with unknown format: {self.path}")
+                pack = None
+
+            entries = pack["entries"] if pack else []
+            self._by_question = {entry["normalized"]: entry for entry in entries}
+            self._by_key = {question_key(entry["normalized"]): entry for entry in entries}
+            self._by_key.pop(frozenset(), None)
+            self.pack = pack
+            servable = self._check_corpus(pack)
+            if generation != self._generation:
+                # Invalidated while checking, the check may have seen the old documents
+                return
+            if servable is None:
+                # Version unknown, don't serve and check again on the next lookup
+                self.servable = False
+                return
+            self._mtime = mtime
+            self.servable = servable
+            if self.servable:
+                print(f"📦 Loaded FAQ answer pack: {len(entries)} answers")
+
+    def _check_corpus(self, pack: Optional[Dict]) -> Optional[bool]:
+        """Whether the pack matches the served documents, None if that is unknown"""
+        if not pack:
+            return False
+
+        if pack.get("corpus") != self.corpus:
+            print(f"⚠️  Ignoring FAQ answer pack built from the {pack.get('corpus')} documents")
+            return False
+
+        if self.corpus_version is None:
+            return True
+
+        try:
+            version = self.corpus_version()
+        except Exception as e:
+            print(f"❌ Error checking FAQ answer pack version: {str(e)}")
+            return None
+
+        if pack.get("index_version") != version:
+            print("⚠️  Ignoring stale FAQ answer pack, documents changed since it was built")
+            return False
+        return True
+
+    def lookup(self, question: str) -> Optional[Dict]:
+        """Return the pack entry matching the question, if any"""
+        self._load()
+        if not self.servable:
+            return None
+
+        normalized = normalize_question(question)
+        entry = self._by_question.get(normalized)
+        if entry is not None:
+            return entry
+
+        # Reordered or politer wording of the same question: the content words
+        # must match exactly, so an added "not" or topic is never answered here
+        key = question_key(normalized)
+        return self._by_key.get(key) if key else None
+
+    def is_current(self, index_version: str, questions: List[str]) -> bool:
+        """Whether the pack was built for this index and FAQ list"""
+        self._load()
+        if not self.pack:
+            return False
+        return (
+            self.pack.get("corpus") == self.corpus
+            and self.pack.get("index_version") == index_version
+            and self.pack.get("model_name") == settings.model_name
+            and [entry["question"] for entry in self.pack["entries"]] == questions
+        )
@@ -3,15 +3,20 @@ from pathlib import Path
 from langchain.schema import Document
 from langchain_community.document_loaders import (
     TextLoader,
-    DirectoryLoader,
     UnstructuredMarkdownLoader,
     PyPDFLoader
 )
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from app.config import get_settings
 
 settings = get_settings()
 
+# Loaders used when (re)loading a single file
+FILE_LOADERS = {
+    ".txt": TextLoader,
+    ".pdf": PyPDFLoader,
+}
+
 class LocalDocumentLoader:
     """Load documents from local filesystem"""
     
@@ -32,32 +37,50 @@ class LocalDocumentLoader:
         # Load text files
         print(f"📁 Loading documents from: {self.documents_path}")
         
+        # Same per-file path the watcher uses, so a full refresh and an
+        # incremental re-index produce identical chunks and metadata
+        counts = {extension: 0 for extension in FILE_LOADERS}
+        for path in sorted(self.scan_files()):
+            file_docs = self.load_file(path)
+            if file_docs:
+                documents.extend(file_docs)
+                counts[Path(path).suffix.lower()] += 1
+        
+        for extension, count in counts.items():
+            print(f"✅ Loaded {count} {extension} files")
+        
+        print(f"📄 Total documents loaded: {len(documents)}")
+        
+        return documents
+    
+    def scan_files(self) -> Dict[str, Tuple[float, int]]:
+        """Return (mtime, size) for every supported file in the directory"""
+        state = {}
+        
+        if not os.path.isdir(self.documents_path):
+            return state
+        
+        for root, _, files in os.walk(self.documents_path):
+            for name in files:
+                if Path(name).suffix.lower() not in FILE_LOADERS:
+                    continue
+                path = str(Path(root) / name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                state[path] = (stat.st_mtime, stat.st_size)
+        
+        return state
+    
+    def load_file(self, path: str) -> Optional[List[Document]]:
+        """Load a single supported file, None if it could not be read"""
+        loader_cls = FILE_LOADERS.get(Path(path).suffix.lower())
+        if loader_cls is None:
+            return []
+        
         try:
-            # Load .txt files
-            txt_loader = DirectoryLoader(
-                self.documents_path,
-                glob="**/*.txt",
-                loader_cls=TextLoader,
-                show_progress=True
-            )
-            txt_docs = txt_loader.load()
-            documents.extend(txt_docs)
-            print(f"✅ Loaded {len(txt_docs)} .txt files")
-
-            # Load .pdf files
-            pdf_loader = DirectoryLoader(
-                self.documents_path,
-                glob="**/*.pdf",
-                loader_cls=PyPDFLoader,
-                show_progress=True
-            )
-            pdf_docs = pdf_loader.load()
-            documents.extend(pdf_docs)
-            print(f"✅ Loaded {len(pdf_docs)} .pdf files")
-            
-            print(f"📄 Total documents loaded: {len(documents)}")
-            
+            return loader_cls(path).load()
         except Exception as e:
-            print(f"❌ Error loading documents: {str(e)}")
-        
-        return documents
\ No newline at end of file
+            print(f"❌ Error loading {path}: {str(e)}")
+            return None
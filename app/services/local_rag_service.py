@@ -5,7 +5,14 @@ from langchain_huggingface import HuggingFaceEmbeddings
 from langchain.chains import ConversationalRetrievalChain
 from langchain.prompts import PromptTemplate
 from app.services.local_loader import LocalDocumentLoader
+from app.services.document_watcher import DocumentWatcher
+from app.services.faq import FAQAnswerPack, load_faq_questions, build_answer_pack, write_answer_pack
 from app.config import get_settings
+from langchain.schema import Document
+from pathlib import Path
+from typing import Dict, Iterable, List
+import hashlib
+import threading
 import os
 
 settings = get_settings()
@@ -14,15 +21,61 @@ class RAGService:
     def __init__(self):
         self.vector_store = None
         self.qa_chain = None
+        self.embeddings = None
         self.loader = LocalDocumentLoader()
+        self.watcher = None
         self.is_initialized = False
+        # Per-file state used for incremental updates
+        self.indexed_files = {}
+        self.chunk_ids: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+        # Only served while it was built from the current index
+        self.faq_pack = FAQAnswerPack(corpus="local", corpus_version=self.index_version)
+        self.faq_auto_rebuild = True
+        self._faq_lock = threading.Lock()
+        self._faq_thread = None
+        self._faq_stale = False
+    
+    def _split(self, documents: List[Document]) -> List[Document]:
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=settings.chunk_size,
+            chunk_overlap=settings.chunk_overlap,
+            length_function=len
+        )
+        return text_splitter.split_documents(documents)
+    
+    def _chunk_ids(self, chunks: List[Document]) -> Dict[str, List[str]]:
+        """Assign stable ids per source file so its chunks can be replaced later"""
+        ids = {}
+        for chunk in chunks:
+            source = chunk.metadata.get("source", "Unknown")
+            file_ids = ids.setdefault(source, [])
+            file_ids.append(f"{source}::{len(file_ids)}")
+        return ids
+    
+    def _get_embeddings(self):
+        if self.embeddings is None:
+            print("🔧 Loading embedding model...")
+            self.embeddings = HuggingFaceEmbeddings(
+                model_name="sentence-transformers/all-MiniLM-L6-v2",
+                model_kwargs={'device': 'cpu'}
+            )
+        return self.embeddings
     
     def initialize(self):
         """Initialize RAG pipeline"""
+        with self._lock:
+            self._initialize()
+    
+    def _initialize(self):
         print("🚀 Initializing RAG system...")
+        self.faq_pack.invalidate()
         print(f"Environment: {settings.environment}")
         print(f"Documents path: {settings.documents_path}")
         
+        # Snapshot before loading so edits made during the load are picked up later
+        file_state = self.loader.scan_files()
+        
         # Load documents
         documents = self.loader.load_documents()
         
@@ -32,28 +85,29 @@ class RAGService:
             raise Exception("No documents loaded")
         
         # Split documents
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap,
-            length_function=len
-        )
-        chunks = text_splitter.split_documents(documents)
+        chunks = self._split(documents)
         print(f"📄 Created {len(chunks)} chunks from {len(documents)} documents")
+        chunk_ids = self._chunk_ids(chunks)
         
         # Create embeddings
-        print("🔧 Loading embedding model...")
-        embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2",
-            model_kwargs={'device': 'cpu'}
-        )
+        embeddings = self._get_embeddings()
         
         # Create vector store
         print("💾 Creating vector store...")
-        self.vector_store = Chroma.from_documents(
-            documents=chunks,
-            embedding=embeddings,
+        self.vector_store = Chroma(
+            embedding_function=embeddings,
             persist_directory=settings.chroma_db_path
         )
+        # The persisted collection may still hold chunks of files that were
+        # deleted or shrank since it was written, drop them before upserting
+        new_ids = [chunk_id for ids in chunk_ids.values() for chunk_id in ids]
+        stale_ids = set(self.vector_store.get(include=[])["ids"]) - set(new_ids)
+        if stale_ids:
+            self.vector_store.delete(ids=list(stale_ids))
+            print(f"🗑️  Removed {len(stale_ids)} stale chunks")
+        self.vector_store.add_documents(chunks, ids=new_ids)
+        self.indexed_files = {path: file_state[path] for path in chunk_ids if path in file_state}
+        self.chunk_ids = chunk_ids
         print(f"✅ Vector store created at: {settings.chroma_db_path}")
         
         # Initialize LLM
@@ -100,6 +154,146 @@ Provide a helpful, professional response that showcases the portfolio owner's qu
         
         self.is_initialized = True
         print("✅ RAG system initialized successfully!")
+        self._schedule_faq_rebuild()
+    
+    def update_documents(self, paths: Iterable[str]) -> Dict[str, int]:
+        """Re-index changed files and drop deleted ones from the vector store"""
+        with self._lock:
+            if not self.is_initialized:
+                self._initialize()
+                return {"updated": len(self.indexed_files), "removed": 0}
+            
+            current = self.loader.scan_files()
+            candidates = set()
+            for path in paths:
+                path = str(Path(path))
+                candidates.add(path)
+                # A directory event covers every file below it
+                prefix = path.rstrip(os.sep) + os.sep
+                candidates.update(
+                    p for p in current.keys() | self.indexed_files.keys()
+                    if p.startswith(prefix)
+                )
+            
+            updated = removed = 0
+            for path in sorted(candidates):
+                state = current.get(path)
+                if state is None:
+                    if path in self.chunk_ids:
+                        self._remove_file(path)
+                        removed += 1
+                    continue
+                # Same mtime and size as indexed, e.g. a duplicate event
+                if self.indexed_files.get(path) == state:
+                    continue
+                if self._index_file(path, state):
+                    updated += 1
+            
+            if updated or removed:
+                print(f"🔄 Re-indexed {updated} file(s), removed {removed} file(s)")
+                self.faq_pack.invalidate()
+                self._schedule_faq_rebuild()
+            return {"updated": updated, "removed": removed}
+    
+    def _remove_file(self, path: str):
+        ids = self.chunk_ids.pop(path, [])
+        if ids:
+            self.vector_store.delete(ids=ids)
+        self.indexed_files.pop(path, None)
+        print(f"🗑️  Removed from index: {path}")
+    
+    def _index_file(self, path: str, state) -> bool:
+        documents = self.loader.load_file(path)
+        if documents is None:
+            # e.g. a PDF caught half-written: keep the old chunks and leave
+            # indexed_files alone so the next event for this file retries
+            print(f"⚠️  Keeping previous index for {path}")
+            return False
+        chunks = self._split(documents)
+        
+        # Drop the old chunks first, the new file may have fewer of them
+        old_ids = self.chunk_ids.pop(path, [])
+        if old_ids:
+            self.vector_store.delete(ids=old_ids)
+        
+        if chunks:
+            ids = self._chunk_ids(chunks)[path]
+            self.vector_store.add_documents(chunks, ids=ids)
+            self.chunk_ids[path] = ids
+        self.indexed_files[path] = state
+        print(f"📄 Re-indexed {path} ({len(chunks)} chunks)")
+        return True
+    
+    def index_version(self) -> str:
+        """Hash of the indexed file contents and chunking settings"""
+        with self._lock:
+            digest = hashlib.sha256()
+            digest.update(f"{settings.chunk_size}:{settings.chunk_overlap}".encode())
+            for path in sorted(self.indexed_files):
+                try:
+                    with open(path, "rb") as f:
+                        content = hashlib.sha256(f.read()).digest()
+                except OSError:
+                    continue
+                digest.update(os.path.relpath(path, self.loader.documents_path).encode())
+                digest.update(content)
+            return digest.hexdigest()
+    
+    def build_faq_pack(self, force: bool = False) -> bool:
+        """Answer the FAQ list with the current index and write the answer pack"""
+        questions = load_faq_questions()
+        if not questions:
+            return False
+        
+        with self._lock:
+            qa_chain = self.get_chain()
+            index_version = self.index_version()
+        
+        if not force and self.faq_pack.is_current(index_version, questions):
+            return False
+        
+        print(f"📦 Building FAQ answer pack ({len(questions)} questions)...")
+        write_answer_pack(build_answer_pack(qa_chain, questions, index_version, corpus="local"))
+        return True
+    
+    def _schedule_faq_rebuild(self):
+        """Rebuild the FAQ answer pack in the background after the index changed"""
+        if not self.faq_auto_rebuild or not os.path.exists(settings.faq_questions_path):
+            return
+        
+        with self._faq_lock:
+            self._faq_stale = True
+            if self._faq_thread is not None:
+                return
+            self._faq_thread = threading.Thread(
+                target=self._rebuild_faq_pack,
+                name="faq-rebuild",
+                daemon=True
+            )
+            self._faq_thread.start()
+    
+    def _rebuild_faq_pack(self):
+        while True:
+            with self._faq_lock:
+                if not self._faq_stale:
+                    self._faq_thread = None
+                    return
+                self._faq_stale = False
+            try:
+                self.build_faq_pack()
+            except Exception as e:
+                print(f"❌ Error building FAQ answer pack: {str(e)}")
+    
+    def start_watcher(self):
+        """Watch the documents directory and apply changes incrementally"""
+        if self.watcher is None:
+            self.watcher = DocumentWatcher(self.loader, self.update_documents)
+        self.watcher.start()
+    
+    def stop_watcher(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
     
     def get_chain(self):
         """Get QA chain, initialize if needed"""
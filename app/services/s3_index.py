@@ -0,0 +1,24 @@
+import boto3
+import hashlib
+from app.config import get_settings
+
+# boto3 only: the Lambda app checks the FAQ pack with this before deciding
+# whether LangChain needs to be loaded at all
+
+settings = get_settings()
+
+def s3_index_version() -> str:
+    """Hash of the S3 document keys, ETags and chunking settings"""
+    s3_client = boto3.client('s3', region_name=settings.aws_region)
+    response = s3_client.list_objects_v2(
+        Bucket=settings.s3_bucket_name,
+        Prefix='documents/'
+    )
+    
+    digest = hashlib.sha256()
+    digest.update(f"{settings.chunk_size}:{settings.chunk_overlap}".encode())
+    for obj in sorted(response.get('Contents', []), key=lambda obj: obj['Key']):
+        if obj['Key'].endswith('/'):
+            continue
+        digest.update(f"{obj['Key']}:{obj['ETag']}".encode())
+    return digest.hexdigest()